@@ -40,7 +40,9 @@ class DirectoryNode(object):
         self.display = display
         self.parent = parent
         self.name = name
-        self.files = []
+        self.files = None
+        self.checked = None
+        self.index_position = 0
         self.top_offset = 0
         self.old_top_offset = -1
         self.selected_offset = 0
@@ -53,6 +55,7 @@ class DirectoryNode(object):
         self.parent = None
         self.name = None
         self.files = None
+        self.checked = None
         return self
 
 
@@ -101,28 +104,44 @@ class DirectoryNode(object):
 
 
     def __get_files(self):
-        """Return a list of the files in this directory.
+        """Read the list of the files in this directory.
            If this is not the top directory on the SD card, a ".." entry is the first element.
-           Any directories have a slash appended to their name."""
-        if len(self.files) == 0:
+           Directories get a slash appended to their name as they are checked, see index().
+           The directory is only read once, even if it turns out to be empty."""
+        if self.files is None:
             self.files = os.listdir(self.__path())
             self.files.sort()
             if self.parent:
                 self.files.insert(0, "..")
-            for index, name in enumerate(self.files, start=1):
-                if self.__is_dir(self.__make_path(name)):
-                    self.files[index] = name + "/"
+            self.checked = [False] * len(self.files)
+            self.index_position = 0
+
+
+    def __check_entry(self, offset):
+        """Append a slash to the name of the file at an offset if it is a directory.
+           Each entry is only checked once.
+           :param int offset: the index of the file in the list
+        """
+        if self.checked[offset]:
+            return
+        self.checked[offset] = True
+        if self.__is_dir(self.__make_path(self.files[offset])):
+            self.files[offset] = self.files[offset] + "/"
 
 
     def __update_display(self):
-        """Update the displayed list of files if required."""
+        """Update the displayed list of files if required.
+           The visible files are checked for directories before drawing, so the list is
+           drawn once with the right names rather than redrawn as index() catches up."""
         if self.top_offset != self.old_top_offset:
             self.__get_files()
             self.display.fill(0)
             for i in range(self.top_offset, min(self.top_offset + 4, self.__number_of_files())):
+                self.__check_entry(i)
                 self.display.text(self.files[i], 10, (i - self.top_offset) * 8)
             self.display.show()
             self.old_top_offset = self.top_offset
+            self.old_selected_offset = -1
 
 
     def __update_selection(self):
@@ -146,6 +165,7 @@ class DirectoryNode(object):
     def selected_filename(self):
         """The name of the currently selected file in this directory."""
         self.__get_files()
+        self.__check_entry(self.selected_offset)
         return self.files[self.selected_offset]
 
 
@@ -163,26 +183,50 @@ class DirectoryNode(object):
         self.__update_selection()
 
 
+    def index(self, count=1):
+        """Check up to count more files to see which are directories, ahead of them being
+           scrolled onto the display. Return whether every file has been checked.
+           This never touches the display; visible files are checked when they are drawn.
+           :param int count: the most files to check in this call (default is 1)
+        """
+        self.__get_files()
+        while count > 0 and self.index_position < len(self.files):
+            self.__check_entry(self.index_position)
+            self.index_position += 1
+            count -= 1
+        return self.index_position >= len(self.files)
+
+
+    @property
+    def indexed(self):
+        """Whether every file in this directory has been checked for being a directory."""
+        return self.files is not None and self.index_position >= len(self.files)
+
+
+    def move(self, delta):
+        """Move the selection by delta files (negative is up), staying within the list,
+           then scroll and redraw the display once.
+           :param int delta: how many files to move the selection by
+        """
+        self.selected_offset = max(0, min(self.selected_offset + delta, self.__number_of_files() - 1))
+        if self.selected_offset < self.top_offset:
+            self.top_offset = self.selected_offset
+        elif self.selected_offset >= self.top_offset + 4:
+            self.top_offset = self.selected_offset - 3
+        self.__update_display()
+        self.__update_selection()
+
+
     def down(self):
         """Move down in the file list if possible, adjusting the selected file indicator
            and scrolling the display as required."""
-        if self.selected_offset < self.__number_of_files() - 1:
-            self.selected_offset += 1
-            if self.selected_offset == self.top_offset + 4:
-                self.top_offset += 1
-                self.__update_display()
-        self.__update_selection()
+        self.move(1)
 
 
     def up(self):
         """Move up in the file list if possible, adjusting the selected file indicator
            and scrolling the display as required."""
-        if self.selected_offset > 0:
-            self.selected_offset -= 1
-            if self.selected_offset < self.top_offset:
-                self.top_offset -= 1
-                self.__update_display()
-        self.__update_selection()
+        self.move(-1)
 
 
     def click(self):
@@ -85,6 +85,10 @@ class Emulator(object):
         self.led_pin.direction = digitalio.Direction.OUTPUT
         self.led_pin.value = False
 
+        # state of a load in progress, see start_load()
+        self.code = None
+        self.load_offset = 0
+
 
     def __pulse_write(self):
         self.write_pin.value = WRITE_ENABLED
@@ -126,15 +130,47 @@ class Emulator(object):
         self.led_pin.value = LED_ON
 
 
-    def load_ram(self, code):
-        """Load the emulator RAM. Automatically switched to program mode.
+    def start_load(self, code):
+        """Begin loading the emulator RAM a chunk at a time, see continue_load().
+           Automatically switches to program mode.
            :param [byte] code: the list of bytes to load into the emulator RAM
         """
         self.enter_program_mode()
         self.__reset_address_counter()
-        for data_byte in code:
+        self.code = code
+        self.load_offset = 0
+
+
+    def continue_load(self, count):
+        """Load up to count more bytes into the emulator RAM. Return whether the load is finished.
+           If no load is in progress there is nothing to do, and it is reported as finished.
+           :param int count: the most bytes to load in this call
+        """
+        if self.code is None:
+            return True
+        end = min(self.load_offset + count, len(self.code))
+        for data_byte in self.code[self.load_offset:end]:
             self.__output_on_port_a(data_byte)
             self.__activate_ram()
             self.__pulse_write()
             self.__deactivate_ram()
             self.__advance_address_counter()
+        self.load_offset = end
+        if self.load_offset >= len(self.code):
+            self.cancel_load()
+            return True
+        return False
+
+
+    def cancel_load(self):
+        """Abandon any load in progress, releasing the code being loaded."""
+        self.code = None
+        self.load_offset = 0
+
+
+    def load_ram(self, code):
+        """Load the emulator RAM all at once. Automatically switched to program mode.
+           :param [byte] code: the list of bytes to load into the emulator RAM
+        """
+        self.start_load(code)
+        self.continue_load(len(code))
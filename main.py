@@ -39,6 +39,7 @@ import adafruit_sdcard
 from directory_node import DirectoryNode
 from emulator import Emulator
 from debouncer import Debouncer
+from scheduler import Scheduler
 
 #--------------------------------------------------------------------------------
 # Initialize Rotary encoder
@@ -96,10 +97,23 @@ rising_edge = falling_edge = UNKNOWN_POSITION
 
 PROGRAM_MODE = 0
 EMULATE_MODE = 1
+LOADING_MODE = 2
 
 current_mode = PROGRAM_MODE
 emulator = Emulator(i2c)
 
+# work handed from the input task to the UI and job tasks
+pending_moves = 0
+pending_click = False
+
+# bytes written to the emulator RAM, and directory entries checked, per task run
+LOAD_CHUNK = 4
+INDEX_CHUNK = 1
+
+# set to True to print per-task timing stats every STATS_INTERVAL seconds
+REPORT_STATS = False
+STATS_INTERVAL = 10.0
+
 
 #--------------------------------------------------------------------------------
 # Helper functions
@@ -122,32 +136,33 @@ def display_emulating_screen():
     oled.show()
 
 
+def display_loading_screen():
+    oled.fill(0)
+    oled.text("Loading", 0, 0)
+    oled.text(current_dir.selected_filename, 0, 10)
+    oled.show()
+
+
 def emulate():
+    """Start loading the selected file; the load task finishes the job."""
     global current_mode
     data = load_file(current_dir.selected_filepath)
-    emulator.load_ram(data)
-    emulator.enter_emulate_mode()
-    current_mode = EMULATE_MODE
-    display_emulating_screen()
+    emulator.start_load(data)
+    current_mode = LOADING_MODE
+    display_loading_screen()
 
 
 def program():
     global current_mode
+    emulator.cancel_load()
     emulator.enter_program_mode()
     current_mode = PROGRAM_MODE
     current_dir.force_update()
 
 
-#--------------------------------------------------------------------------------
-# Main loop
-
-current_dir = DirectoryNode(oled, name="/sd")
-current_dir.force_update()
-rising_edge = falling_edge = UNKNOWN_POSITION
-rotary_prev_state = [rot_a.value, rot_b.value]
-
-while True:
-    # reset encoder and wait for the next turn
+def read_encoder():
+    """Sample the rotary encoder, returning -1, 0, or 1 for the direction of a completed detent."""
+    global rising_edge, falling_edge, rotary_prev_state, encoder_counter
     encoder_direction = 0
 
     # take a 'snapshot' of the rotary encoder state at this time
@@ -165,7 +180,7 @@ while True:
                 print("Falling B")
                 falling_edge = B_POSITION
             else:
-                continue
+                return 0
 
         if rotary_curr_state == [True, True]:
             if not rotary_prev_state[B_POSITION]:
@@ -175,7 +190,7 @@ while True:
                 rising_edge = A_POSITION
                 print("Rising A")
             else:
-                continue
+                return 0
 
             # check first and last edge
             if (rising_edge == A_POSITION) and (falling_edge == B_POSITION):
@@ -195,19 +210,84 @@ while True:
 
         rotary_prev_state = rotary_curr_state
 
-        # Handle encoder rotation
+    return encoder_direction
+
+
+#--------------------------------------------------------------------------------
+# Tasks
+
+def sample_input():
+    """Poll the encoder and button, queueing work for the other tasks."""
+    global pending_moves, pending_click
+    encoder_direction = read_encoder()
     if current_mode == PROGRAM_MODE:      #Ignore rotation if in EMULATE mode
-        if encoder_direction == -1:
-            current_dir.up()
-        elif encoder_direction == 1:
-            current_dir.down()
+        pending_moves += encoder_direction
 
     # look for a press of the rotary encoder switch press, with debouncing
     button.update()
     if button.fell:
-        if current_mode == EMULATE_MODE:
-            program()
-        elif is_binary_name(current_dir.selected_filename):
-            emulate()
-        else:
-            current_dir = current_dir.click()
+        pending_click = True
+
+
+def render_ui():
+    """Move the file selection by the net of any queued encoder turns, redrawing once."""
+    global pending_moves
+    if pending_moves != 0:
+        current_dir.move(pending_moves)
+        pending_moves = 0
+
+
+def run_jobs():
+    """Act on a queued button press: start a load, return to program mode, or navigate.
+       Queued turns are applied first so the press acts on the selection the user sees."""
+    global pending_click, current_dir
+    if not pending_click:
+        return
+    pending_click = False
+    render_ui()
+    if current_mode != PROGRAM_MODE:      # also cancels a load in progress
+        program()
+    elif is_binary_name(current_dir.selected_filename):
+        emulate()
+    else:
+        current_dir = current_dir.click()
+
+
+def run_load():
+    """Write the next chunk of a load in progress, switching to emulate mode when done."""
+    global current_mode
+    if current_mode != LOADING_MODE:
+        return
+    if emulator.continue_load(LOAD_CHUNK):
+        emulator.enter_emulate_mode()
+        current_mode = EMULATE_MODE
+        display_emulating_screen()
+
+
+def run_index():
+    """Check the next entries of the current directory to see which are directories."""
+    if current_mode == PROGRAM_MODE and not current_dir.indexed:
+        current_dir.index(INDEX_CHUNK)
+
+
+#--------------------------------------------------------------------------------
+# Main loop
+
+current_dir = DirectoryNode(oled, name="/sd")
+current_dir.force_update()
+rising_edge = falling_edge = UNKNOWN_POSITION
+rotary_prev_state = [rot_a.value, rot_b.value]
+
+# Input is critical so it is sampled every tick. Everything else is done in small
+# pieces so no single task run holds input off for long, with the exception of
+# reading a file into memory when a load starts.
+scheduler = Scheduler(budget=0.010, max_sleep=0.050)
+scheduler.add("input", sample_input, 0.001, deadline=0.002, priority=0, critical=True)
+scheduler.add("ui", render_ui, 0.020, deadline=0.050, priority=1)
+scheduler.add("jobs", run_jobs, 0.050, priority=2)
+scheduler.add("load", run_load, 0.001, deadline=0.010, priority=3)
+scheduler.add("index", run_index, 0.005, deadline=0.010, priority=4)
+if REPORT_STATS:
+    scheduler.add("stats", scheduler.report, STATS_INTERVAL, priority=5)
+
+scheduler.run()
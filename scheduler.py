@@ -0,0 +1,191 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2018 Dave Astels
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+
+--------------------------------------------------------------------------------
+A small cooperative scheduler for the main loop.
+
+Times are given in seconds but kept internally as integer nanoseconds from
+time.monotonic_ns(). CircuitPython floats lose millisecond resolution after a
+few hours of uptime, which would stop periods from advancing.
+"""
+
+import time
+
+NS_PER_SECOND = 1000000000
+
+
+def to_ns(seconds):
+    """Convert seconds to integer nanoseconds.
+       :param float seconds: the time to convert
+    """
+    return int(seconds * NS_PER_SECOND)
+
+
+def to_seconds(ns):
+    """Convert integer nanoseconds to seconds.
+       :param int ns: the time to convert
+    """
+    return ns / NS_PER_SECOND
+
+
+class Task(object):
+    """A periodic job run by the scheduler, along with its timing stats."""
+
+    def __init__(self, name, function, period, deadline=None, priority=0, critical=False, clock=time.monotonic_ns):
+        """Make an instance.
+           :param string name: the name used when reporting stats
+           :param function function: called with no arguments each time the task runs
+           :param float period: seconds between runs
+           :param float deadline: seconds a run may take before it counts as an overrun (default is the period)
+           :param int priority: lower numbers run first within a tick (default is 0)
+           :param bool critical: run even if the tick's latency budget is used up (default is False)
+           :param function clock: returns the current time in integer nanoseconds (default is time.monotonic_ns)
+        """
+        self.name = name
+        self.function = function
+        self.period = to_ns(period)
+        if deadline is None:
+            self.deadline = self.period
+        else:
+            self.deadline = to_ns(deadline)
+        self.priority = priority
+        self.critical = critical
+        self.clock = clock
+        self.next_run = 0
+        self.reset_stats()
+
+
+    def reset_stats(self):
+        """Clear the timing stats."""
+        self.runs = 0
+        self.total_time = 0
+        self.max_time = 0
+        self.max_lateness = 0
+        self.overruns = 0
+        self.deferrals = 0
+
+
+    def run(self, now):
+        """Run the task, record how long it took, and schedule the next run.
+           :param int now: the time the tick started, in nanoseconds
+        """
+        lateness = now - self.next_run
+        start = self.clock()
+        self.function()
+        elapsed = self.clock() - start
+        self.runs += 1
+        self.total_time += elapsed
+        if elapsed > self.max_time:
+            self.max_time = elapsed
+        if lateness > self.max_lateness:
+            self.max_lateness = lateness
+        if elapsed > self.deadline:
+            self.overruns += 1
+        # Don't try to catch up on missed periods; just stay on the grid if we can.
+        self.next_run += self.period
+        if self.next_run <= now:
+            self.next_run = now + self.period
+
+
+    @property
+    def average_time(self):
+        """Return the average run time in nanoseconds."""
+        if self.runs == 0:
+            return 0
+        return self.total_time // self.runs
+
+
+    def __str__(self):
+        return "{}: runs {} avg {:.4f} max {:.4f} late {:.4f} overruns {} deferred {}".format(
+            self.name, self.runs, to_seconds(self.average_time), to_seconds(self.max_time),
+            to_seconds(self.max_lateness), self.overruns, self.deferrals)
+
+
+class Scheduler(object):
+    """Run tasks cooperatively, sleeping when nothing is due."""
+
+    def __init__(self, budget=0.010, max_sleep=0.050, clock=time.monotonic_ns):
+        """Make an instance.
+           :param float budget: seconds of non-critical work allowed per tick (default is 0.010)
+           :param float max_sleep: longest idle sleep in seconds (default is 0.050)
+           :param function clock: returns the current time in integer nanoseconds (default is time.monotonic_ns)
+        """
+        self.budget = to_ns(budget)
+        self.max_sleep = to_ns(max_sleep)
+        self.clock = clock
+        self.tasks = []
+
+
+    def add(self, name, function, period, deadline=None, priority=0, critical=False):
+        """Add a task, returning it. See Task for the parameters."""
+        task = Task(name, function, period, deadline, priority, critical, self.clock)
+        task.next_run = self.clock()
+        self.tasks.append(task)
+        self.tasks.sort(key=lambda t: t.priority)
+        return task
+
+
+    def tick(self):
+        """Run every task that is due, in priority order.
+           Once the latency budget is used up, only critical tasks run. The rest
+           stay due and run on a later tick, still in priority order, so a
+           low priority task can be deferred tick after tick if higher priority
+           ones keep using the budget. The budget is only checked before a task
+           starts; it can't preempt a task that is already running."""
+        now = self.clock()
+        for task in self.tasks:
+            if task.next_run > now:
+                continue
+            if not task.critical and self.clock() - now >= self.budget:
+                task.deferrals += 1
+                continue
+            task.run(now)
+
+
+    def idle_time(self):
+        """Return how many seconds to sleep before the next task is due, capped at max_sleep."""
+        if not self.tasks:
+            return to_seconds(self.max_sleep)
+        next_run = min(task.next_run for task in self.tasks)
+        return to_seconds(max(0, min(next_run - self.clock(), self.max_sleep)))
+
+
+    def run(self):
+        """Tick forever, sleeping whenever nothing is due."""
+        while True:
+            self.tick()
+            delay = self.idle_time()
+            if delay > 0:
+                time.sleep(delay)
+
+
+    def reset_stats(self):
+        """Clear the timing stats of all tasks."""
+        for task in self.tasks:
+            task.reset_stats()
+
+
+    def report(self):
+        """Print the timing stats of all tasks."""
+        for task in self.tasks:
+            print(task)
@@ -0,0 +1,146 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2018 Dave Astels
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+
+--------------------------------------------------------------------------------
+Host tests for the directory node, using a temporary directory and a fake display.
+"""
+
+import os
+
+import directory_node
+from directory_node import DirectoryNode
+
+
+class FakeDisplay(object):
+    """Records what is on the screen and how often it was shown."""
+
+    def __init__(self):
+        self.lines = {}
+        self.shows = 0
+
+    def fill(self, colour):
+        self.lines = {}
+
+    def text(self, string, x, y, colour=1):
+        if x > 0:
+            self.lines[y // 8] = string
+
+    def show(self):
+        self.shows += 1
+
+
+def make_tree(root, files, dirs):
+    for name in files:
+        open(os.path.join(str(root), name), "w").close()
+    for name in dirs:
+        os.mkdir(os.path.join(str(root), name))
+
+
+def count_listdir(monkeypatch):
+    calls = []
+    real_listdir = os.listdir
+
+    def listdir(path):
+        calls.append(path)
+        return real_listdir(path)
+
+    monkeypatch.setattr(directory_node.os, "listdir", listdir)
+    return calls
+
+
+def test_slashes_on_the_right_entries(tmp_path):
+    make_tree(tmp_path, ["a.bin", "c.bin", "e.bin"], ["b", "d"])
+    node = DirectoryNode(FakeDisplay(), name=str(tmp_path))
+    while not node.index(2):
+        pass
+    assert node.files == ["a.bin", "b/", "c.bin", "d/", "e.bin"]
+
+
+def test_parent_entry_is_not_a_directory(tmp_path):
+    make_tree(tmp_path, [], ["sub"])
+    make_tree(tmp_path / "sub", ["x.bin"], ["y"])
+    parent = DirectoryNode(FakeDisplay(), name=str(tmp_path))
+    child = DirectoryNode(FakeDisplay(), parent, "sub/")
+    while not child.index():
+        pass
+    assert child.files == ["..", "x.bin", "y/"]
+
+
+def test_selected_filename_checks_on_demand(tmp_path):
+    make_tree(tmp_path, ["a.bin", "b.bin", "c.bin", "d.bin", "e.bin"], ["z"])
+    display = FakeDisplay()
+    node = DirectoryNode(display, name=str(tmp_path))
+    node.force_update()
+    node.selected_offset = 5
+    assert node.index_position == 0
+    assert node.selected_filename == "z/"
+
+
+def test_visible_entries_drawn_once_with_slashes(tmp_path):
+    make_tree(tmp_path, ["a.bin"], ["b", "c", "d"])
+    display = FakeDisplay()
+    node = DirectoryNode(display, name=str(tmp_path))
+    node.force_update()
+    assert display.lines == {0: "a.bin", 1: "b/", 2: "c/", 3: "d/"}
+    shows = display.shows
+    while not node.index():
+        pass
+    assert display.shows == shows
+
+
+def test_move_clamps_and_scrolls(tmp_path):
+    make_tree(tmp_path, ["f%d.bin" % i for i in range(10)], [])
+    display = FakeDisplay()
+    node = DirectoryNode(display, name=str(tmp_path))
+    node.force_update()
+    node.move(-3)
+    assert (node.selected_offset, node.top_offset) == (0, 0)
+    node.move(5)
+    assert (node.selected_offset, node.top_offset) == (5, 2)
+    node.move(100)
+    assert (node.selected_offset, node.top_offset) == (9, 6)
+    node.move(-4)
+    assert (node.selected_offset, node.top_offset) == (5, 5)
+    node.move(-100)
+    assert (node.selected_offset, node.top_offset) == (0, 0)
+    assert display.lines[0] == "f0.bin"
+
+
+def test_move_redraws_once(tmp_path):
+    make_tree(tmp_path, ["f%d.bin" % i for i in range(10)], [])
+    display = FakeDisplay()
+    node = DirectoryNode(display, name=str(tmp_path))
+    node.force_update()
+    shows = display.shows
+    node.move(7)
+    assert display.shows - shows == 2    # one list redraw, one selection update
+
+
+def test_empty_directory_listed_once(tmp_path, monkeypatch):
+    calls = count_listdir(monkeypatch)
+    node = DirectoryNode(FakeDisplay(), name=str(tmp_path))
+    node.force_update()
+    for _ in range(200):
+        node.index()
+    assert node.indexed
+    assert len(calls) == 1
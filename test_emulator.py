@@ -0,0 +1,127 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2018 Dave Astels
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+
+--------------------------------------------------------------------------------
+Host tests for the emulator, with the hardware libraries stubbed out.
+"""
+
+import sys
+import types
+
+
+class FakePin(object):
+
+    def __init__(self, mcp, number):
+        self.mcp = mcp
+        self.number = number
+        self.direction = None
+        self._value = None
+
+    @property
+    def value(self):
+        return self._value
+
+    @value.setter
+    def value(self, value):
+        # the write pin is active low; record the data port at the end of each pulse
+        if self.number == 9 and value and self._value is False:
+            self.mcp.written.append(self.mcp.gpio & 0xFF)
+        self._value = value
+
+
+class FakeMCP23017(object):
+
+    def __init__(self, i2c):
+        self.iodir = 0xFFFF
+        self.gpio = 0
+        self.written = []
+
+    def get_pin(self, number):
+        return FakePin(self, number)
+
+
+def stub_modules():
+    digitalio = types.ModuleType("digitalio")
+    digitalio.Direction = types.SimpleNamespace(INPUT=0, OUTPUT=1)
+    mcp230xx = types.ModuleType("adafruit_mcp230xx")
+    mcp230xx.MCP23017 = FakeMCP23017
+    sys.modules.setdefault("digitalio", digitalio)
+    sys.modules.setdefault("adafruit_mcp230xx", mcp230xx)
+
+
+stub_modules()
+
+from emulator import Emulator
+
+
+def load_in_chunks(emulator, code, count):
+    emulator.start_load(code)
+    calls = 1
+    while not emulator.continue_load(count):
+        calls += 1
+    return calls
+
+
+def test_chunk_not_dividing_length():
+    emulator = Emulator(None)
+    code = bytes(range(10))
+    assert load_in_chunks(emulator, code, 4) == 3
+    assert emulator.mcp.written == list(code)
+    assert emulator.code is None
+
+
+def test_chunk_dividing_length():
+    emulator = Emulator(None)
+    code = bytes(range(8))
+    assert load_in_chunks(emulator, code, 4) == 2
+    assert emulator.mcp.written == list(code)
+
+
+def test_zero_length_image():
+    emulator = Emulator(None)
+    assert load_in_chunks(emulator, b"", 4) == 1
+    assert emulator.mcp.written == []
+
+
+def test_load_ram_matches_chunked_load():
+    emulator = Emulator(None)
+    code = bytes([0x12, 0x34, 0x56])
+    emulator.load_ram(code)
+    assert emulator.mcp.written == list(code)
+
+
+def test_continue_without_load_is_finished():
+    emulator = Emulator(None)
+    assert emulator.continue_load(4)
+    assert emulator.mcp.written == []
+
+
+def test_cancel_releases_code():
+    emulator = Emulator(None)
+    emulator.start_load(bytes(range(10)))
+    emulator.continue_load(4)
+    emulator.cancel_load()
+    assert emulator.code is None
+    assert emulator.load_offset == 0
+    assert emulator.continue_load(4)
+    assert emulator.mcp.written == [0, 1, 2, 3]
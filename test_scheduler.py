@@ -0,0 +1,113 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2018 Dave Astels
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+
+--------------------------------------------------------------------------------
+Host tests for the scheduler, using a fake clock.
+"""
+
+from scheduler import Scheduler, to_ns
+
+
+class FakeClock(object):
+    """A clock that only moves when told to."""
+
+    def __init__(self):
+        self.now = 0
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += to_ns(seconds)
+
+
+def make_scheduler(budget=0.010, max_sleep=0.050):
+    clock = FakeClock()
+    return Scheduler(budget=budget, max_sleep=max_sleep, clock=clock), clock
+
+
+def test_deferral_once_budget_used_up():
+    scheduler, clock = make_scheduler(budget=0.010)
+    ran = []
+    slow = scheduler.add("slow", lambda: (ran.append("slow"), clock.advance(0.012)), 0.020, priority=1)
+    later = scheduler.add("later", lambda: ran.append("later"), 0.020, priority=2)
+    scheduler.tick()
+    assert ran == ["slow"]
+    assert later.deferrals == 1
+    assert slow.deferrals == 0
+    scheduler.tick()
+    assert ran == ["slow", "later"]
+
+
+def test_critical_task_always_runs():
+    scheduler, clock = make_scheduler(budget=0.010)
+    ran = []
+    scheduler.add("slow", lambda: clock.advance(0.050), 0.001, priority=0)
+    critical = scheduler.add("input", lambda: ran.append("input"), 0.001, priority=1, critical=True)
+    for _ in range(5):
+        scheduler.tick()
+    assert ran == ["input"] * 5
+    assert critical.deferrals == 0
+
+
+def test_no_catch_up_on_missed_periods():
+    scheduler, clock = make_scheduler()
+    task = scheduler.add("task", lambda: None, 0.010)
+    clock.advance(0.100)
+    scheduler.tick()
+    assert task.runs == 1
+    assert task.next_run == clock.now + to_ns(0.010)
+    scheduler.tick()
+    assert task.runs == 1
+
+
+def test_stays_on_grid_when_slightly_late():
+    scheduler, clock = make_scheduler()
+    task = scheduler.add("task", lambda: None, 0.010)
+    start = task.next_run
+    clock.advance(0.003)
+    scheduler.tick()
+    assert task.next_run == start + to_ns(0.010)
+
+
+def test_idle_time_capped_at_max_sleep():
+    scheduler, clock = make_scheduler(max_sleep=0.050)
+    scheduler.add("task", lambda: None, 10.0)
+    scheduler.tick()
+    assert scheduler.idle_time() == 0.050
+
+
+def test_idle_time_until_next_task():
+    scheduler, clock = make_scheduler(max_sleep=0.050)
+    scheduler.add("task", lambda: None, 0.020)
+    scheduler.tick()
+    clock.advance(0.005)
+    assert abs(scheduler.idle_time() - 0.015) < 1e-9
+
+
+def test_overrun_counted():
+    scheduler, clock = make_scheduler()
+    task = scheduler.add("task", lambda: clock.advance(0.003), 0.010, deadline=0.002)
+    scheduler.tick()
+    assert task.overruns == 1
+    assert task.max_time == to_ns(0.003)